@@ -10,7 +10,6 @@ import sys
 import json
 from typing import Dict, List, Any, Tuple
 from config_loader import DeploymentConfig
-from lightsail_rds import LightsailRDSManager
 from os_detector import OSDetector
 
 class DependencyManager:
@@ -1426,40 +1425,54 @@ echo "✅ PostgreSQL application access configured"
             'nodejs': 'nodejs-app'
         }
         
-        success = True
-        
-        for dep in self.installed_dependencies:
-            if dep in service_map:
-                service_name = service_map[dep]
-                restart_script = f'''
+        services = [service_map[dep] for dep in self.installed_dependencies if dep in service_map]
+        if not services:
+            print("ℹ️  No services to restart")
+            return True
+
+        service_list = ' '.join(services)
+
+        # systemctl accepts a variadic unit list and restarts the units in one
+        # dbus transaction, so all services go through a single invocation
+        # (and a single SSH round-trip) instead of one call per service
+        restart_script = f'''
 set -e
-echo "Restarting {service_name} on {self.os_type}..."
+echo "Restarting services on {self.os_type}: {service_list}"
 
-# Check if service exists first
-if {self.svc_commands['status']} {service_name} >/dev/null 2>&1 || systemctl list-unit-files | grep -q "^{service_name}.service"; then
-    {self.svc_commands['restart']} {service_name}
-    {self.svc_commands['enable']} {service_name}
-    
-    # Wait a moment and verify it's running
-    sleep 2
-    if {self.svc_commands['is_active']} {service_name}; then
-        echo "✅ {service_name} restarted and running"
+# Only restart units that actually exist on this host
+EXISTING=""
+for service in {service_list}; do
+    if systemctl list-unit-files | grep -q "^${{service}}.service"; then
+        EXISTING="$EXISTING $service"
     else
-        echo "⚠️  {service_name} restarted but not active"
-        {self.svc_commands['status']} {service_name} --no-pager || true
+        echo "ℹ️  $service service not found, skipping"
     fi
-else
-    echo "ℹ️  {service_name} service not found, skipping"
+done
+
+if [ -n "$EXISTING" ]; then
+    {self.svc_commands['restart']} $EXISTING
+    {self.svc_commands['enable']} $EXISTING
+
+    # Wait a moment and verify everything is running
+    sleep 2
+    for service in $EXISTING; do
+        if {self.svc_commands['is_active']} $service; then
+            echo "✅ $service restarted and running"
+        else
+            echo "⚠️  $service restarted but not active"
+            {self.svc_commands['status']} $service --no-pager || true
+        fi
+    done
 fi
 '''
-                
-                svc_success, output = self.client.run_command(restart_script, timeout=60)
-                if not svc_success:
-                    print(f"⚠️  Failed to restart {service_name}")
-                    print(f"Output: {output}")
-                    success = False
-        
-        return success
+
+        svc_success, output = self.client.run_command(restart_script, timeout=120)
+        if not svc_success:
+            print(f"⚠️  Failed to restart services: {service_list}")
+            print(f"Output: {output}")
+            return False
+
+        return True
 
     def _install_external_database(self, db_type: str, config: Dict[str, Any]) -> bool:
         """
@@ -1486,6 +1499,10 @@ fi
             # Initialize RDS manager
             # Note: Uses the same AWS credentials that GitHub Actions configured
             # No need to pass separate credentials - boto3 will use the environment
+            # Imported here because lightsail_rds pulls in boto3 at module
+            # level - keeping it out of this module's imports preserves the
+            # deferred SDK load for CLIs that never touch RDS
+            from lightsail_rds import LightsailRDSManager
             rds_manager = LightsailRDSManager(
                 instance_name=self.client.instance_name,
                 region=rds_config.get('region', 'us-east-1')
@@ -7,13 +7,176 @@ This script handles application deployment and service configuration based on co
 import sys
 import os
 import argparse
+import concurrent.futures
+import io
+import string
+import threading
 from lightsail_common import LightsailBase
 from config_loader import DeploymentConfig
 from dependency_manager import DependencyManager
 from os_detector import OSDetector
 from app_configurators.configurator_factory import ConfiguratorFactory
 
+class _ShellTemplate(string.Template):
+    """string.Template variant using @{name} placeholders so the shell's own
+    $vars and $(...) substitutions pass through without escaping"""
+    delimiter = '@'
+
+class _ThreadOutputRouter(io.TextIOBase):
+    """stdout proxy that diverts registered worker threads into private buffers
+
+    run_command prints the command echo and the full remote output directly,
+    so two SSH phases running in a thread pool would interleave their blocks
+    line by line. Each worker registers a buffer before doing any work;
+    unregistered threads (the main thread) pass through untouched.
+    """
+
+    def __init__(self, passthrough):
+        self._passthrough = passthrough
+        self._buffers = {}
+
+    def register(self) -> io.StringIO:
+        """Divert the calling thread's writes into a new buffer"""
+        buffer = io.StringIO()
+        self._buffers[threading.get_ident()] = buffer
+        return buffer
+
+    def write(self, text):
+        buffer = self._buffers.get(threading.get_ident())
+        target = buffer if buffer is not None else self._passthrough
+        return target.write(text)
+
+    def flush(self):
+        if threading.get_ident() not in self._buffers:
+            self._passthrough.flush()
+
+# Static shell for the file-deployment phase, compiled once at import and
+# rendered per unique substitution set (see _render_deploy_script)
+_DEPLOY_SCRIPT_TEMPLATE = _ShellTemplate('''
+set -e
+echo "Deploying application files to @{target_dir}..."
+
+# Create backup of existing files - reflink=auto shares blocks on
+# copy-on-write filesystems (xfs/btrfs) and falls back to a normal copy
+# elsewhere, so the backup costs metadata instead of a full data rewrite.
+# find -print -quit stops at the first entry, so the emptiness probe does
+# not read the whole directory listing the way ls -A does
+if [ -d "@{target_dir}" ] && find "@{target_dir}/" -mindepth 1 -maxdepth 1 -print -quit 2>/dev/null | grep -q .; then
+    BACKUP_DIR="/var/backups/app/$(date +%Y%m%d_%H%M%S)"
+    sudo mkdir -p "$BACKUP_DIR"
+    sudo cp -r --reflink=auto @{target_dir}/* "$BACKUP_DIR/" || true
+    echo "✅ Backup created at $BACKUP_DIR"
+fi
+
+# Extracted contents live in the home directory
+cd ~
+@{extract_step}
+
+# Find the extracted directory based on config
+echo "🔍 Looking for extracted directories..."
+ls -la
+
+@{dir_checks}
+
+# Determine the source directory to deploy from
+if [ -n "$EXTRACTED_DIR" ]; then
+    echo "✅ Found extracted directory: $EXTRACTED_DIR"
+    echo "📋 Contents of $EXTRACTED_DIR:"
+    ls -la "$EXTRACTED_DIR" | head -20
+
+    # Check if this is a React app with build directory
+    if [ -d "$EXTRACTED_DIR/build" ]; then
+        echo "React build directory detected, deploying build files..."
+        SOURCE_DIR="$EXTRACTED_DIR/build"
+    else
+        SOURCE_DIR="$EXTRACTED_DIR"
+    fi
+else
+    echo "⚠️  No application directory found (example-*-app or mcp-server), copying all files"
+    echo "📋 Current directory contents:"
+    ls -la | head -20
+
+    # Check if build directory exists at root level
+    if [ -d "build" ]; then
+        echo "Build directory detected at root, deploying build files..."
+        SOURCE_DIR="./build"
+    else
+        SOURCE_DIR="."
+    fi
+fi
+
+# Deploy into a timestamped release directory and swap a symlink into
+# place, so the running server never sees a half-copied tree and the
+# previous release stays around for rollback
+RELEASES_DIR="@{target_dir}-releases"
+RELEASE_DIR="$RELEASES_DIR/$(date +%s)"
+sudo mkdir -p "$RELEASE_DIR"
+
+if [ -L "@{target_dir}" ]; then
+    PREV_RELEASE=$(readlink -f "@{target_dir}")
+else
+    PREV_RELEASE=""
+fi
+
+echo "📦 Populating release $RELEASE_DIR from $SOURCE_DIR/"
+if command -v rsync > /dev/null 2>&1; then
+    # --link-dest hardlinks files unchanged since the previous release,
+    # so only changed content consumes disk and I/O
+    sudo rsync -a ${PREV_RELEASE:+--link-dest="$PREV_RELEASE"} "$SOURCE_DIR"/ "$RELEASE_DIR"/ || true
+else
+    sudo cp -r --reflink=auto "$SOURCE_DIR"/* "$RELEASE_DIR"/ || true
+fi
+
+# Set proper ownership on the new release before it goes live
+echo "📝 Setting file permissions (@{owner})"
+sudo chown -R @{owner} "$RELEASE_DIR"
+
+# u=rwX,go=rX gives 755 directories and 644 files (capital X only keeps
+# the execute bit on directories and already-executable files) in a
+# single traversal - no per-file chmod forks
+sudo chmod -R u=rwX,go=rX "$RELEASE_DIR"
+
+# A plain directory from older deploys blocks the symlink swap - move it
+# aside once; afterwards ln -sfn replaces the link atomically
+if [ -d "@{target_dir}" ] && [ ! -L "@{target_dir}" ]; then
+    sudo mv "@{target_dir}" "$RELEASES_DIR/pre-symlink-backup"
+fi
+sudo ln -sfn "$RELEASE_DIR" "@{target_dir}"
+
+# Keep only the most recent releases around for rollback
+ls -1dt "$RELEASES_DIR"/*/ 2>/dev/null | tail -n +6 | xargs -r sudo rm -rf
+
+# Verify files were copied
+echo ""
+echo "📋 Files in @{target_dir} after deployment:"
+ls -la @{target_dir}/ | head -20
+
+echo "✅ Set ownership to @{owner}"
+
+echo "✅ Application files deployed successfully"
+''')
+
 class GenericPostDeployer:
+    # Dependency name -> systemd unit used for service detection
+    SERVICE_UNITS = {
+        'apache': 'apache2.service',
+        'nginx': 'nginx.service',
+        'mysql': 'mysql.service',
+        'postgresql': 'postgresql.service',
+        'redis': 'redis-server.service',
+        'memcached': 'memcached.service',
+        'docker': 'docker.service',
+    }
+
+    # Dependency name -> binary used for runtime detection
+    BINARY_CHECKS = {
+        'php': 'php',
+        'python': 'python3',
+        'nodejs': 'node',
+        'git': 'git',
+        'apache': 'apache2',
+    }
+
     def __init__(self, instance_name=None, region=None, config=None, os_type=None, package_manager=None):
         # Initialize configuration
         if config is None:
@@ -27,6 +190,8 @@ class GenericPostDeployer:
             
         self.config = config
         self.client = LightsailBase(instance_name, region)
+        self._script_cache = {}
+        self._out = io.StringIO()
         
         # Set OS information on client for configurators to use
         if os_type:
@@ -35,7 +200,6 @@ class GenericPostDeployer:
             self.client.os_info = {'package_manager': package_manager, 'user': 'ubuntu' if package_manager == 'apt' else 'ec2-user'}
         
         # Initialize dependency manager with OS information
-        from os_detector import OSDetector
         if os_type and package_manager:
             os_info = OSDetector.get_user_info(os_type)
             os_info['package_manager'] = package_manager
@@ -43,177 +207,284 @@ class GenericPostDeployer:
             self.dependency_manager = DependencyManager(self.client, config, os_type, os_info)
         else:
             self.dependency_manager = DependencyManager(self.client, config)
-        
+
+        # Cache OS-specific user info once - several deployment phases need it
+        # and the OS type does not change for the lifetime of a deployer
+        self.user_info = OSDetector.get_user_info(getattr(self.client, 'os_type', 'ubuntu'))
+
         # Load installed dependencies from the system
         self._detect_installed_dependencies()
 
     def _detect_installed_dependencies(self):
         """Detect which dependencies are currently installed on the system"""
         enabled_deps = self.dependency_manager.get_enabled_dependencies()
-        
-        # Check which services are actually running/installed
-        check_script = '''
-set -e
+
+        # Only scan the units and binaries for dependencies the deployment
+        # config actually enables - a nodejs-only deploy has no reason to
+        # query apache/mysql/postgres state on the remote host
+        service_deps = [dep for dep in self.SERVICE_UNITS if dep in enabled_deps]
+        binary_deps = [dep for dep in self.BINARY_CHECKS if dep in enabled_deps]
+        if not service_deps and not binary_deps:
+            return
+
+        # Batch all service and binary checks into two invocations on the remote
+        # host - systemctl show accepts a variadic unit list, so one call covers
+        # every service instead of one is-active fork per unit
+        units = ' '.join(self.SERVICE_UNITS[dep] for dep in service_deps)
+        binaries = ' '.join(dict.fromkeys(self.BINARY_CHECKS[dep] for dep in binary_deps))
+        service_check = f'systemctl show --property=ActiveState {units} 2>/dev/null || true' if units else ''
+        binary_check = f'command -v {binaries} 2>/dev/null || true' if binaries else ''
+        check_script = f'''
 echo "Checking installed services..."
+{service_check}
+echo "---BINARIES---"
+{binary_check}
+echo "Service check completed"
+'''
 
-# Check for web servers
-systemctl is-active --quiet apache2 && echo "apache:installed" || true
-systemctl is-active --quiet nginx && echo "nginx:installed" || true
+        success, output = self.client.run_command(check_script, timeout=60)
+        if not success:
+            return
 
-# Check for databases
-systemctl is-active --quiet mysql && echo "mysql:installed" || true
-systemctl is-active --quiet postgresql && echo "postgresql:installed" || true
+        service_output, _, binary_output = output.partition('---BINARIES---')
 
-# Check for other services
-systemctl is-active --quiet redis-server && echo "redis:installed" || true
-systemctl is-active --quiet memcached && echo "memcached:installed" || true
-systemctl is-active --quiet docker && echo "docker:installed" || true
+        detected = set()
 
-# Check for programming languages
-which php > /dev/null 2>&1 && echo "php:installed" || true
-which python3 > /dev/null 2>&1 && echo "python:installed" || true
-which node > /dev/null 2>&1 && echo "nodejs:installed" || true
-which git > /dev/null 2>&1 && echo "git:installed" || true
-which apache2 > /dev/null 2>&1 && echo "apache:installed" || true
+        # systemctl show emits one ActiveState line per requested unit, in order
+        active_states = [line.split('=', 1)[1].strip()
+                         for line in service_output.split('\n')
+                         if line.startswith('ActiveState=')]
+        for dep_name, state in zip(service_deps, active_states):
+            if state == 'active':
+                detected.add(dep_name)
 
-echo "Service check completed"
-'''
-        
-        success, output = self.client.run_command(check_script, timeout=60)
-        if success:
-            for line in output.split('\n'):
-                if ':installed' in line:
-                    dep_name = line.split(':')[0]
-                    if dep_name in enabled_deps:
-                        self.dependency_manager.installed_dependencies.append(dep_name)
-
-    def deploy_application(self, package_file, verify=False, cleanup=False, env_vars=None):
+        # command -v prints the full path of each binary that exists
+        binary_owners = {self.BINARY_CHECKS[dep]: dep for dep in binary_deps}
+        for line in binary_output.split('\n'):
+            binary_name = os.path.basename(line.strip())
+            if binary_name in binary_owners:
+                detected.add(binary_owners[binary_name])
+
+        for dep_name in service_deps + [d for d in binary_deps if d not in service_deps]:
+            if dep_name in detected:
+                self.dependency_manager.installed_dependencies.append(dep_name)
+
+    @staticmethod
+    def _call_buffered(router, func):
+        """Run func on a worker thread with its prints diverted to a buffer
+
+        Returns:
+            Tuple of (func's result, captured output)
+        """
+        buffer = router.register()
+        return func(), buffer.getvalue()
+
+    @staticmethod
+    def _deployment_env_vars():
+        """Recover the --env variables merged into the process environment
+
+        main() does os.environ.update() once and records the merged keys in
+        DEPLOYMENT_ENV_KEYS, so the deployer reads them back here instead of
+        having an env_vars dict threaded through every call.
+        """
+        keys = os.environ.get('DEPLOYMENT_ENV_KEYS', '')
+        return {key: os.environ[key]
+                for key in keys.split(',') if key and key in os.environ}
+
+    def deploy_application(self, package_file, verify=False, cleanup=False):
         """Deploy application and configure services"""
-        print(f"🚀 Starting generic application deployment")
-        print(f"📦 Package File: {package_file}")
-        print(f"🔍 Verify: {verify}")
-        print(f"🧹 Cleanup: {cleanup}")
-        
+        env_vars = self._deployment_env_vars()
+        self._emit(f"🚀 Starting generic application deployment")
+        self._emit(f"📦 Package File: {package_file}")
+        self._emit(f"🔍 Verify: {verify}")
+        self._emit(f"🧹 Cleanup: {cleanup}")
+
         app_type = self.config.get('application.type', 'web')
         app_name = self.config.get('application.name', 'Generic Application')
         app_version = self.config.get('application.version', '1.0.0')
-        
-        print(f"📋 Application: {app_name} v{app_version}")
-        print(f"🏷️  Type: {app_type}")
-        print(f"🌍 Instance: {self.client.instance_name}")
-        print(f"📍 Region: {self.client.region}")
-        
+
+        self._emit(f"📋 Application: {app_name} v{app_version}")
+        self._emit(f"🏷️  Type: {app_type}")
+        self._emit(f"🌍 Instance: {self.client.instance_name}")
+        self._emit(f"📍 Region: {self.client.region}")
+
         # Check if Docker deployment is enabled
         docker_enabled = self.config.get('dependencies.docker.enabled', False)
         use_docker_deployment = docker_enabled and self.config.get('deployment.use_docker', False)
-        
+
         if use_docker_deployment:
-            print("\n🐳 Docker deployment mode enabled")
-            print("="*60)
-            print("🐳 DEPLOYING WITH DOCKER")
-            print("="*60)
-            
+            self._emit("\n🐳 Docker deployment mode enabled")
+            self._emit("="*60)
+            self._emit("🐳 DEPLOYING WITH DOCKER")
+            self._emit("="*60)
+            self._flush_output()
+
             # Use Docker configurator for deployment
             docker_configurator = ConfiguratorFactory.get_docker_configurator(self.client, self.config)
             success = docker_configurator.deploy_with_docker(package_file, env_vars)
-            
+
             if not success:
                 print("❌ Docker deployment failed")
                 return False
-            
+
             # Skip traditional configuration for Docker deployments
-            print("\n✅ Docker deployment completed - skipping traditional service configuration")
+            self._emit("\n✅ Docker deployment completed - skipping traditional service configuration")
         else:
             # Traditional deployment
-            print("\n📦 Traditional deployment mode")
+            self._emit("\n📦 Traditional deployment mode")
             # Deploy application files
-            print("\n" + "="*60)
-            print("📦 DEPLOYING APPLICATION FILES")
-            print("="*60)
+            self._emit("\n" + "="*60)
+            self._emit("📦 DEPLOYING APPLICATION FILES")
+            self._emit("="*60)
+            self._flush_output()
             success = self._deploy_application_files(package_file)
             if not success:
                 print("❌ Failed to deploy application files")
                 return False
-            
+
             # Configure application based on type and dependencies
-            print("\n" + "="*60)
-            print("🔧 CONFIGURING APPLICATION")
-            print("="*60)
+            self._emit("\n" + "="*60)
+            self._emit("🔧 CONFIGURING APPLICATION")
+            self._emit("="*60)
+            self._flush_output()
             success = self._configure_application()
             if not success:
-                print("⚠️  Application configuration had some issues")
-        
+                self._emit("⚠️  Application configuration had some issues")
+
         # Only run traditional configuration steps if not using Docker
         if not use_docker_deployment:
-            # Set up application-specific configurations
-            print("\n" + "="*60)
-            print("⚙️  APPLICATION-SPECIFIC CONFIGURATIONS")
-            print("="*60)
-            success = self._setup_app_specific_config()
-            if not success:
-                print("⚠️  Some application-specific configurations failed")
-            
-            # Restart services
-            print("\n" + "="*60)
-            print("🔄 RESTARTING SERVICES")
-            print("="*60)
-            success = self.dependency_manager.restart_services()
-            if not success:
-                print("⚠️  Some services failed to restart")
-        
-            # Verify application services are running after restart
-            print("\n🔍 Verifying application services after restart...")
-            verify_script = '''
-echo "Checking application services..."
-for service in nodejs-app python-app; do
-    if systemctl list-unit-files | grep -q "^${service}.service"; then
-        if systemctl is-active --quiet ${service}.service; then
-            echo "✅ ${service} service is running"
-        else
-            echo "⚠️  ${service} service is not running"
-            sudo systemctl status ${service}.service --no-pager || true
-        fi
-    fi
-done
-'''
-            self.client.run_command(verify_script, timeout=30)
-        
-        # Set environment variables if provided
+            # Application-specific configuration (logrotate, log directories)
+            # and the service restarts touch disjoint paths and have no
+            # ordering dependency, so run them concurrently - wall time is
+            # the slower of the two instead of their sum
+            self._emit("\n" + "="*60)
+            self._emit("⚙️  APPLICATION CONFIG + SERVICE RESTART (parallel)")
+            self._emit("="*60)
+            self._flush_output()
+            # Both phases print through run_command, so each worker's output
+            # is routed into its own buffer and replayed whole after the
+            # join - the log shows two contiguous blocks, not an interleaving
+            router = _ThreadOutputRouter(sys.stdout)
+            original_stdout, sys.stdout = sys.stdout, router
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                    config_future = executor.submit(
+                        self._call_buffered, router, self._setup_app_specific_config)
+                    restart_future = executor.submit(
+                        self._call_buffered, router, self.dependency_manager.restart_services)
+                    config_ok, config_output = config_future.result()
+                    restart_ok, restart_output = restart_future.result()
+            finally:
+                sys.stdout = original_stdout
+            for phase_output in (config_output, restart_output):
+                if phase_output:
+                    self._emit(phase_output.rstrip('\n'))
+            if not config_ok:
+                self._emit("⚠️  Some application-specific configurations failed")
+            if not restart_ok:
+                self._emit("⚠️  Some services failed to restart")
+
+        # Batch the remaining phases into a single SSH round-trip - each
+        # separate run_command pays connection setup latency, so the tail
+        # phases are staged and streamed in one call
+        stages = []
         if env_vars:
-            print("\n🌍 Setting deployment environment variables...")
-            self._set_deployment_env_vars(env_vars)
-        
-        # Verify deployment if requested
+            stages.append(('env-vars', self._env_vars_script(env_vars), 30))
         if verify:
-            print("\n" + "="*60)
-            print("🔍 VERIFYING DEPLOYMENT")
-            print("="*60)
-            success = self._verify_deployment()
-            if not success:
-                print("⚠️  Deployment verification had issues")
-        
-        # Cleanup if requested
-        if cleanup:
-            print("\n" + "="*60)
-            print("🧹 CLEANING UP TEMPORARY FILES")
-            print("="*60)
-            self._cleanup_deployment()
-        
-        # Optimize performance
-        print("\n" + "="*60)
-        print("⚡ OPTIMIZING PERFORMANCE")
-        print("="*60)
-        self._optimize_performance()
-        
-        print("\n" + "="*60)
-        print("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
-        print("="*60)
-        print(f"✅ Application: {app_name} v{app_version}")
-        print(f"🌐 Instance: {self.client.instance_name}")
-        print(f"📍 Region: {self.client.region}")
-        print(f"🏷️  Type: {app_type}")
+            stages.append(('verify', self._verify_deployment_script(), 60))
+        stages.append(('completion', self._completion_script(cleanup), 120))
+
+        self._emit("\n" + "="*60)
+        self._emit(f"🏁 COMPLETION PHASES ({', '.join(name for name, _, _ in stages)})")
+        self._emit("="*60)
+        self._flush_output()
+        results = self._run_staged(stages)
+
+        for stage_name, (stage_success, _) in results.items():
+            if stage_success:
+                self._emit(f"✅ Stage '{stage_name}' completed successfully")
+            else:
+                self._emit(f"⚠️  Stage '{stage_name}' had issues")
+
+        if verify and not results.get('verify', (False, ''))[0]:
+            self._emit("⚠️  Deployment verification had issues")
+
+        self._emit("\n" + "="*60)
+        self._emit("🎉 DEPLOYMENT COMPLETED SUCCESSFULLY!")
+        self._emit("="*60)
+        self._emit(f"✅ Application: {app_name} v{app_version}")
+        self._emit(f"🌐 Instance: {self.client.instance_name}")
+        self._emit(f"📍 Region: {self.client.region}")
+        self._emit(f"🏷️  Type: {app_type}")
+        self._flush_output()
         return True
-    
+
+    def _emit(self, line=''):
+        """Buffer a status line; flushed as one stdout write at phase boundaries"""
+        self._out.write(line + '\n')
+
+    def _flush_output(self):
+        """Write all buffered status lines to stdout in a single write call"""
+        text = self._out.getvalue()
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            self._out.truncate(0)
+            self._out.seek(0)
+
+    def _run_staged(self, stages):
+        """
+        Run several deployment phase scripts in a single SSH round-trip
+
+        Each stage runs in its own subshell so a failing stage does not abort
+        the ones after it; marker lines in the output are parsed afterwards to
+        attribute success or failure to each phase.
+
+        Args:
+            stages: List of (name, script, timeout) tuples
+
+        Returns:
+            dict: Stage name -> (success: bool, output: str)
+        """
+        parts = []
+        total_timeout = 0
+        for name, script, timeout in stages:
+            total_timeout += timeout
+            parts.append(f'''echo "===STAGE:{name}==="
+(
+{script}
+)
+echo "===STAGE_RC:{name}:$?==="''')
+
+        success, output = self.client.run_command('\n'.join(parts), timeout=total_timeout)
+
+        results = {}
+        current_stage = None
+        stage_lines = []
+        for line in output.split('\n'):
+            if line.startswith('===STAGE_RC:'):
+                marker = line.strip('=').split(':')
+                if len(marker) == 3 and marker[1] == current_stage:
+                    results[current_stage] = (marker[2] == '0', '\n'.join(stage_lines))
+                current_stage = None
+                stage_lines = []
+            elif line.startswith('===STAGE:'):
+                current_stage = line.strip('=').split(':', 1)[1]
+                stage_lines = []
+            elif current_stage is not None:
+                stage_lines.append(line)
+
+        if not success and not results:
+            # SSH-level failure - no stage markers came back at all
+            return {name: (False, output) for name, _, _ in stages}
+
+        # Stages missing from the output never ran (e.g. connection dropped)
+        for name, _, _ in stages:
+            if name not in results:
+                results[name] = (False, '')
+
+        return results
+
     def _get_target_directory(self) -> str:
         """Determine target directory based on app type and dependencies"""
         app_type = self.config.get('application.type')
@@ -264,13 +535,9 @@ done
     
     def _get_file_owner(self, target_dir: str) -> str:
         """Determine appropriate file owner based on target directory and dependencies (OS-agnostic)"""
-        # Get OS-specific user information
-        os_type = getattr(self.client, 'os_type', 'ubuntu')
-        user_info = OSDetector.get_user_info(os_type)
-        
-        default_user = user_info['default_user']
-        web_user = user_info['web_user']
-        web_group = user_info['web_group']
+        default_user = self.user_info['default_user']
+        web_user = self.user_info['web_user']
+        web_group = self.user_info['web_group']
         
         # Node.js and Python apps run as default user
         if target_dir in ['/opt/nodejs-app', '/opt/python-app', '/opt/docker-app', '/opt/app']:
@@ -291,138 +558,75 @@ done
         # Get expected directory from config
         package_files = self.config.get('application.package_files', [])
         expected_dirs = []
+        seen_dirs = set()
         for pf in package_files:
             # Extract directory name from patterns like "mcp-server/" or "example-app/"
             # Only add if it looks like a directory (ends with / or contains /)
             if '/' in pf:
-                dir_name = pf.rstrip('/').split('/')[0] if pf else None
-                if dir_name and dir_name not in expected_dirs:
+                dir_name = pf.rstrip('/').split('/', 1)[0]
+                if dir_name and dir_name not in seen_dirs:
+                    seen_dirs.add(dir_name)
                     expected_dirs.append(dir_name)
         
-        # First, copy the package file to the remote instance
+        # Stream the tarball straight into tar on the instance - transfer and
+        # decompression overlap and no intermediate copy lands on remote disk
         print(f"📤 Uploading package file {package_file} to remote instance...")
-        # Use home directory instead of /tmp to avoid permission issues
-        remote_package_path = f"~/{package_file}"
-        
-        if not self.client.copy_file_to_instance(package_file, remote_package_path):
-            print(f"❌ Failed to upload package file to remote instance")
-            return False
-        
-        # Build directory search logic based on config
-        dir_checks = ""
-        if expected_dirs:
-            for i, dir_name in enumerate(expected_dirs):
-                if i == 0:
-                    dir_checks += f'''
-if [ -d "./{dir_name}" ]; then
-    EXTRACTED_DIR="./{dir_name}"
-    echo "✅ Found configured directory: {dir_name}"'''
-                else:
-                    dir_checks += f'''
-elif [ -d "./{dir_name}" ]; then
-    EXTRACTED_DIR="./{dir_name}"
-    echo "✅ Found configured directory: {dir_name}"'''
-            dir_checks += '''
-else
-    EXTRACTED_DIR=$(find . -maxdepth 1 -type d -name "example-*-app" | head -n 1)
-fi'''
+        if self.client.stream_file_to_command(package_file, 'tar -xzf - -C ~', timeout=420):
+            extract_step = 'echo "Package already extracted via streamed upload"'
         else:
-            dir_checks = '''EXTRACTED_DIR=$(find . -maxdepth 1 -type d -name "example-*-app" | head -n 1)'''
-        
-        script = f'''
-set -e
-echo "Deploying application files to {target_dir}..."
-
-# Create backup of existing files
-if [ -d "{target_dir}" ] && [ "$(ls -A {target_dir})" ]; then
-    BACKUP_DIR="/var/backups/app/$(date +%Y%m%d_%H%M%S)"
-    sudo mkdir -p "$BACKUP_DIR"
-    sudo cp -r {target_dir}/* "$BACKUP_DIR/" || true
-    echo "✅ Backup created at $BACKUP_DIR"
-fi
-
-# Extract application package from home directory
-echo "Extracting application package..."
-cd ~
-tar -xzf {package_file}
-
-# Find the extracted directory based on config
-echo "🔍 Looking for extracted directories..."
-ls -la
-
-{dir_checks}
-
-# Deploy files to target directory
-sudo mkdir -p {target_dir}
-
-if [ -n "$EXTRACTED_DIR" ]; then
-    echo "✅ Found extracted directory: $EXTRACTED_DIR"
-    echo "📋 Contents of $EXTRACTED_DIR:"
-    ls -la "$EXTRACTED_DIR" | head -20
-    
-    # Check if this is a React app with build directory
-    if [ -d "$EXTRACTED_DIR/build" ]; then
-        echo "React build directory detected, deploying build files..."
-        sudo cp -r "$EXTRACTED_DIR/build"/* {target_dir}/ || true
-    else
-        # Copy contents of the extracted directory
-        echo "📦 Copying $EXTRACTED_DIR/* to {target_dir}/"
-        sudo cp -r "$EXTRACTED_DIR"/* {target_dir}/ || true
-    fi
-else
-    echo "⚠️  No application directory found (example-*-app or mcp-server), copying all files"
-    echo "📋 Current directory contents:"
-    ls -la | head -20
-    
-    # Check if build directory exists at root level
-    if [ -d "build" ]; then
-        echo "Build directory detected at root, deploying build files..."
-        sudo cp -r build/* {target_dir}/ || true
-    else
-        # Copy all files directly
-        echo "📦 Copying all files to {target_dir}/"
-        sudo cp -r * {target_dir}/ || true
-    fi
-fi
+            print("⚠️  Streamed upload failed, falling back to copy + extract...")
+            # Use home directory instead of /tmp to avoid permission issues
+            remote_package_path = f"~/{package_file}"
 
-# Verify files were copied
-echo ""
-echo "📋 Files in {target_dir} after deployment:"
-ls -la {target_dir}/ | head -20
+            if not self.client.copy_file_to_instance(package_file, remote_package_path):
+                print(f"❌ Failed to upload package file to remote instance")
+                return False
 
-# Set proper ownership
-'''
+            extract_step = f'''echo "Extracting application package..."
+tar -xzf {package_file}'''
         
         # Get appropriate owner for this deployment
         owner = self._get_file_owner(target_dir)
-        
-        # Get OS-specific user information for web user check
-        os_type = getattr(self.client, 'os_type', 'ubuntu')
-        user_info = OSDetector.get_user_info(os_type)
-        web_user = user_info['web_user']
-        web_group = user_info['web_group']
-        web_owner = f"{web_user}:{web_group}"
-        
-        script += f'''
-echo "📝 Setting file permissions ({owner})"
-sudo chown -R {owner} {target_dir}
-sudo chmod -R 755 {target_dir}
-
-# Set stricter permissions for web-served files
-if [ "{owner}" = "{web_owner}" ]; then
-    sudo find {target_dir} -type f -exec chmod 644 {{}} \\;
-fi
 
-echo "✅ Set ownership to {owner}"
-'''
-        
-        script += '''
-echo "✅ Application files deployed successfully"
-'''
-        
+        script = self._render_deploy_script(target_dir, tuple(expected_dirs), extract_step, owner)
+
         success, output = self.client.run_command(script, timeout=420)
         return success
 
+    def _render_deploy_script(self, target_dir, expected_dirs, extract_step, owner) -> str:
+        """Render the file-deployment script from the precompiled template,
+        caching the result so repeat deploys in one session (e.g. multiple
+        instances with the same config) skip the re-render"""
+        cache_key = (target_dir, expected_dirs, extract_step, owner)
+        script = self._script_cache.get(cache_key)
+        if script is None:
+            script = _DEPLOY_SCRIPT_TEMPLATE.substitute(
+                target_dir=target_dir,
+                extract_step=extract_step,
+                dir_checks=self._build_dir_checks(expected_dirs),
+                owner=owner
+            )
+            self._script_cache[cache_key] = script
+        return script
+
+    @staticmethod
+    def _build_dir_checks(expected_dirs) -> str:
+        """Build the shell branch that locates the extracted directory"""
+        fallback = 'EXTRACTED_DIR=$(find . -maxdepth 1 -type d -name "example-*-app" | head -n 1)'
+        if not expected_dirs:
+            return fallback
+
+        branches = []
+        for i, dir_name in enumerate(expected_dirs):
+            keyword = 'if' if i == 0 else 'elif'
+            branches.append(f'''{keyword} [ -d "./{dir_name}" ]; then
+    EXTRACTED_DIR="./{dir_name}"
+    echo "✅ Found configured directory: {dir_name}"''')
+        branches.append(f'''else
+    {fallback}
+fi''')
+        return '\n'.join(branches)
+
     def _configure_application(self) -> bool:
         """Configure application based on installed dependencies using modular configurators"""
         print(f"🔍 Detected installed dependencies: {self.dependency_manager.installed_dependencies}")
@@ -461,11 +665,8 @@ echo "✅ Application files deployed successfully"
     def _setup_app_specific_config(self) -> bool:
         """Set up application-specific configurations (OS-agnostic)"""
         app_type = self.config.get('application.type', 'web')
-        
-        # Get OS-specific user information
-        os_type = getattr(self.client, 'os_type', 'ubuntu')
-        user_info = OSDetector.get_user_info(os_type)
-        default_user = user_info['default_user']
+
+        default_user = self.user_info['default_user']
         
         script = f'''
 set -e
@@ -490,6 +691,18 @@ sudo mv /tmp/app-logs /etc/logrotate.d/app
 sudo mkdir -p /var/log/app
 sudo chown {default_user}:{default_user} /var/log/app
 
+# Package cache cleanup runs from cron instead of the deploy hot path -
+# apt-get autoremove can take tens of seconds and is not needed for a
+# deploy to succeed
+cat > /tmp/app-cleanup << 'EOF'
+#!/bin/sh
+apt-get clean >/dev/null 2>&1 || true
+apt-get autoremove -y >/dev/null 2>&1 || true
+EOF
+
+sudo mv /tmp/app-cleanup /etc/cron.weekly/app-cleanup
+sudo chmod 755 /etc/cron.weekly/app-cleanup
+
 # Set up cron jobs for maintenance (if needed)
 # This is a placeholder for application-specific maintenance tasks
 
@@ -499,22 +712,16 @@ echo "✅ Application-specific configurations completed"
         success, output = self.client.run_command(script, timeout=60)
         return success
 
-    def _set_deployment_env_vars(self, env_vars):
-        """Set deployment-specific environment variables (OS-agnostic)"""
-        if not env_vars:
-            return
-        
+    def _env_vars_script(self, env_vars) -> str:
+        """Build script that sets deployment-specific environment variables (OS-agnostic)"""
         env_content = []
         for key, value in env_vars.items():
             env_content.append(f'{key}="{value}"')
         
         env_file_content = '\n'.join(env_content)
-        
-        # Get OS-specific user information
-        os_type = getattr(self.client, 'os_type', 'ubuntu')
-        user_info = OSDetector.get_user_info(os_type)
-        web_user = user_info['web_user']
-        web_group = user_info['web_group']
+
+        web_user = self.user_info['web_user']
+        web_group = self.user_info['web_group']
         
         script = f'''
 set -e
@@ -546,11 +753,11 @@ sudo rm -f /tmp/deployment_vars
 
 echo "✅ Deployment environment variables set"
 '''
-        
-        success, output = self.client.run_command(script, timeout=30)
 
-    def _verify_deployment(self) -> bool:
-        """Verify that the deployment was successful"""
+        return script
+
+    def _verify_deployment_script(self) -> str:
+        """Build script that verifies the deployment was successful"""
         health_config = self.config.get_health_check_config()
         endpoint = health_config.get('endpoint', '/')
         expected_content = health_config.get('expected_content', 'Hello')
@@ -592,29 +799,45 @@ else
     echo "⚠️  No main application files found"
 fi
 
-# Test local HTTP response
+# Test local HTTP response - curl retries natively and returns the moment
+# the endpoint answers instead of sleeping a fixed 2s between attempts
 echo "Testing local HTTP response..."
-for i in {{1..5}}; do
-    if curl -s http://localhost{endpoint} | grep -q "{expected_content}"; then
-        echo "✅ Application responds correctly"
-        exit 0
-    fi
-    echo "Waiting for application to respond... ($i/5)"
-    sleep 2
-done
+if curl -sS --retry 10 --retry-delay 1 --retry-connrefused --retry-all-errors http://localhost{endpoint} 2>/dev/null | grep -q "{expected_content}"; then
+    echo "✅ Application responds correctly"
+    exit 0
+fi
 
-echo "⚠️  Application response test failed after 5 attempts"
+echo "⚠️  Application response test failed"
 curl -v http://localhost{endpoint} || true
 
 echo "✅ Deployment verification completed"
 '''
-        
-        success, output = self.client.run_command(script, timeout=60)
-        return success
 
-    def _cleanup_deployment(self):
-        """Clean up temporary deployment files"""
-        script = '''
+        return script
+
+    def _completion_script(self, cleanup) -> str:
+        """Build the final completion stage
+
+        Cleanup and performance optimization touch disjoint paths, so when
+        both are requested they run as background subshells on the remote
+        host - the instance parallelizes them itself with no extra SSH calls.
+        """
+        if not cleanup:
+            return self._optimize_script()
+
+        return f'''
+(
+{self._cleanup_script()}
+) &
+(
+{self._optimize_script()}
+) &
+wait
+'''
+
+    def _cleanup_script(self) -> str:
+        """Build script that cleans up temporary deployment files"""
+        return '''
 set -e
 echo "Cleaning up deployment files..."
 
@@ -623,17 +846,12 @@ sudo rm -f /tmp/*.tar.gz
 sudo rm -f /tmp/app.*
 sudo rm -rf /tmp/deployment_*
 
-# Clean package manager caches
-sudo apt-get clean || true
-
 echo "✅ Cleanup completed"
 '''
-        
-        success, output = self.client.run_command(script, timeout=60)
 
-    def _optimize_performance(self):
-        """Optimize system and application performance"""
-        script = '''
+    def _optimize_script(self) -> str:
+        """Build script that optimizes system and application performance"""
+        return '''
 set -e
 echo "🔧 Starting performance optimization..."
 
@@ -642,9 +860,8 @@ for webserver in apache2 nginx; do
     if systemctl is-active --quiet $webserver 2>/dev/null; then
         echo "⚡ Optimizing $webserver web server..."
         if [ "$webserver" = "apache2" ]; then
-            sudo a2enmod deflate 2>/dev/null || true
-            sudo a2enmod expires 2>/dev/null || true
-            sudo a2enmod headers 2>/dev/null || true
+            # a2enmod takes multiple modules - one config scan instead of three
+            sudo a2enmod deflate expires headers 2>/dev/null || true
             sudo systemctl reload apache2 2>/dev/null || true
         fi
         echo "✅ $webserver performance optimized"
@@ -656,10 +873,14 @@ if which php > /dev/null 2>&1; then
     echo "⚡ Optimizing PHP configuration..."
     for PHP_INI in /etc/php/*/apache2/php.ini /etc/php/*/fpm/php.ini; do
         if [ -f "$PHP_INI" ]; then
-            sudo sed -i 's/;opcache.enable=1/opcache.enable=1/' "$PHP_INI" 2>/dev/null || true
-            sudo sed -i 's/;opcache.memory_consumption=128/opcache.memory_consumption=128/' "$PHP_INI" 2>/dev/null || true
-            sudo sed -i 's/;opcache.max_accelerated_files=4000/opcache.max_accelerated_files=10000/' "$PHP_INI" 2>/dev/null || true
-            sudo sed -i 's/;opcache.revalidate_freq=2/opcache.revalidate_freq=60/' "$PHP_INI" 2>/dev/null || true
+            # One sed invocation with multiple expressions rewrites the
+            # file once instead of four read/write passes
+            sudo sed -i \\
+                -e 's/;opcache.enable=1/opcache.enable=1/' \\
+                -e 's/;opcache.memory_consumption=128/opcache.memory_consumption=128/' \\
+                -e 's/;opcache.max_accelerated_files=4000/opcache.max_accelerated_files=10000/' \\
+                -e 's/;opcache.revalidate_freq=2/opcache.revalidate_freq=60/' \\
+                "$PHP_INI" 2>/dev/null || true
         fi
     done
     echo "✅ PHP performance optimized"
@@ -671,39 +892,33 @@ sudo sysctl -w vm.swappiness=10 || true
 sudo sysctl -w net.core.rmem_max=16777216 || true
 sudo sysctl -w net.core.wmem_max=16777216 || true
 
-# Clear system caches
-echo "🧹 Clearing system caches..."
-sudo apt-get clean || true
-sudo apt-get autoremove -y || true
-
 echo "✅ Performance optimization completed successfully"
 '''
-        
-        success, output = self.client.run_command(script, timeout=60)
-    
+
     def _print_deployment_summary(self):
         """Print deployment summary information"""
-        print("\n" + "="*60)
-        print("📊 DEPLOYMENT SUMMARY")
-        print("="*60)
-        
+        self._emit("\n" + "="*60)
+        self._emit("📊 DEPLOYMENT SUMMARY")
+        self._emit("="*60)
+        self._flush_output()
+
         # Get instance info
         instance_info = self.client.get_instance_info()
         if instance_info:
-            print(f"🖥️  Instance Name: {instance_info['name']}")
-            print(f"🌐 Public IP: {instance_info.get('public_ip', 'N/A')}")
-            print(f"🔒 Private IP: {instance_info.get('private_ip', 'N/A')}")
-            print(f"📦 Blueprint: {instance_info.get('blueprint', 'N/A')}")
-            print(f"💾 Bundle: {instance_info.get('bundle', 'N/A')}")
-            print(f"⚡ State: {instance_info.get('state', 'N/A')}")
+            self._emit(f"🖥️  Instance Name: {instance_info['name']}")
+            self._emit(f"🌐 Public IP: {instance_info.get('public_ip', 'N/A')}")
+            self._emit(f"🔒 Private IP: {instance_info.get('private_ip', 'N/A')}")
+            self._emit(f"📦 Blueprint: {instance_info.get('blueprint', 'N/A')}")
+            self._emit(f"💾 Bundle: {instance_info.get('bundle', 'N/A')}")
+            self._emit(f"⚡ State: {instance_info.get('state', 'N/A')}")
         
         # Show installed dependencies
         if hasattr(self.dependency_manager, 'installed_dependencies'):
             installed = self.dependency_manager.installed_dependencies
             if installed:
-                print(f"\n🔧 Installed Dependencies ({len(installed)}):")
+                self._emit(f"\n🔧 Installed Dependencies ({len(installed)}):")
                 for dep in installed:
-                    print(f"   ✅ {dep}")
+                    self._emit(f"   ✅ {dep}")
         
         # Show application configuration
         app_config = {
@@ -713,13 +928,13 @@ echo "✅ Performance optimization completed successfully"
             'PHP Version': self.config.get('application.php_version', '8.1'),
         }
         
-        print(f"\n📋 Application Configuration:")
+        self._emit(f"\n📋 Application Configuration:")
         for key, value in app_config.items():
-            print(f"   {key}: {value}")
+            self._emit(f"   {key}: {value}")
         
-        print("\n🎯 Next Steps:")
+        self._emit("\n🎯 Next Steps:")
         if instance_info and instance_info.get('public_ip'):
-            print(f"   🌐 Visit: http://{instance_info['public_ip']}")
+            self._emit(f"   🌐 Visit: http://{instance_info['public_ip']}")
         
         # Show relevant log locations based on what's installed
         log_locations = []
@@ -733,7 +948,7 @@ echo "✅ Performance optimization completed successfully"
             log_locations.append("/var/log/python-app/")
         
         if log_locations:
-            print(f"   📝 Check logs: {', '.join(log_locations)}")
+            self._emit(f"   📝 Check logs: {', '.join(log_locations)}")
         
         # Show relevant config locations
         config_locations = []
@@ -745,7 +960,7 @@ echo "✅ Performance optimization completed successfully"
             config_locations.append("/opt/python-app/")
         
         if config_locations:
-            print(f"   🔧 Config files: {', '.join(config_locations)}")
+            self._emit(f"   🔧 Config files: {', '.join(config_locations)}")
         
         # Show relevant services to monitor
         services = []
@@ -765,78 +980,136 @@ echo "✅ Performance optimization completed successfully"
             services.append("docker")
         
         if services:
-            print(f"   📊 Monitor: systemctl status {' '.join(services)}")
-        
-        print("="*60)
+            self._emit(f"   📊 Monitor: systemctl status {' '.join(services)}")
 
-def main():
-    parser = argparse.ArgumentParser(description='Generic post-deployment steps for AWS Lightsail')
-    parser.add_argument('package_file', help='Application package file to deploy')
+        self._emit("="*60)
+        self._flush_output()
+
+def _add_deploy_arguments(parser):
+    """Register the optional deployment arguments
+
+    Built lazily - invocations that only pass the positional package file and
+    --config-file never pay for constructing the remaining argparse actions.
+    """
     parser.add_argument('--instance-name', help='Lightsail instance name (overrides config)')
     parser.add_argument('--region', help='AWS region (overrides config)')
-    parser.add_argument('--config-file', help='Path to configuration file')
     parser.add_argument('--verify', action='store_true', help='Verify deployment')
     parser.add_argument('--cleanup', action='store_true', help='Clean up temporary files')
     parser.add_argument('--env', action='append', help='Environment variables (KEY=VALUE)')
     parser.add_argument('--os-type', help='Operating system type (ubuntu, amazon_linux, centos, rhel)')
     parser.add_argument('--package-manager', help='Package manager (apt, yum, dnf)')
+
+def main():
+    parser = argparse.ArgumentParser(description='Generic post-deployment steps for AWS Lightsail')
+    parser.add_argument('package_file', help='Application package file to deploy')
+    parser.add_argument('--config-file', help='Path to configuration file')
+    # Defaults for the lazily-registered arguments so args always has every
+    # attribute, even when the full set is never constructed
+    parser.set_defaults(instance_name=None, region=None, verify=False,
+                        cleanup=False, env=None, os_type=None, package_manager=None)
+
+    if '-h' in sys.argv[1:] or '--help' in sys.argv[1:]:
+        # Help output must show the full argument set
+        _add_deploy_arguments(parser)
+
+    args, extra_args = parser.parse_known_args()
+    if extra_args:
+        # Optional deployment flags were actually passed - register the
+        # remaining actions and reparse strictly
+        _add_deploy_arguments(parser)
+        args = parser.parse_args()
     
-    args = parser.parse_args()
-    
+    # Load configuration - DeploymentConfig surfaces failures as
+    # FileNotFoundError (missing file), ValueError (invalid YAML) or
+    # RuntimeError (other read errors)
     try:
-        # Load configuration
         config_file = args.config_file if args.config_file else 'deployment-generic.config.yml'
         config = DeploymentConfig(config_file=config_file)
-        
-        # Use command line args if provided, otherwise use config
-        instance_name = args.instance_name or config.get_instance_name()
-        region = args.region or config.get_aws_region()
-        
-        print(f"🚀 Starting generic post-deployment steps for {instance_name}")
-        print(f"🌍 Region: {region}")
-        print(f"📦 Package: {args.package_file}")
-        print(f"📋 Application: {config.get('application.name', 'Unknown')} v{config.get('application.version', '1.0.0')}")
-        print(f"🏷️  Type: {config.get('application.type', 'web')}")
-        
-        # Parse environment variables
-        env_vars = {}
-        if args.env:
-            for env_var in args.env:
-                if '=' in env_var:
-                    key, value = env_var.split('=', 1)
-                    env_vars[key] = value
-        
-        # Check if dependency steps are enabled in config
-        if not config.get('deployment.steps.post_deployment.dependencies.enabled', True):
-            print("ℹ️  Dependency configuration steps are disabled in configuration")
-        
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
+        print(f"❌ Error loading configuration: {str(e)}")
+        sys.exit(1)
+
+    # Use command line args if provided, otherwise use config
+    instance_name = args.instance_name or config.instance_name
+    region = args.region or config.aws_region
+
+    app_name, app_version, app_type = config.get_many([
+        ('application.name', 'Unknown'),
+        ('application.version', '1.0.0'),
+        ('application.type', 'web'),
+    ])
+    # One write for the whole banner instead of five print calls
+    sys.stdout.write(
+        f"🚀 Starting generic post-deployment steps for {instance_name}\n"
+        f"🌍 Region: {region}\n"
+        f"📦 Package: {args.package_file}\n"
+        f"📋 Application: {app_name} v{app_version}\n"
+        f"🏷️  Type: {app_type}\n"
+    )
+
+    # Parse environment variables - partition splits on the first '=' and
+    # its empty separator drops malformed entries in the same pass
+    env_vars = {key: value
+                for key, sep, value in (env_var.partition('=') for env_var in args.env or [])
+                if sep}
+    # Merge them into the process environment once; the deployer reads them
+    # back from os.environ (keys recorded in DEPLOYMENT_ENV_KEYS) instead of
+    # having the dict threaded through every call
+    if env_vars:
+        os.environ.update(env_vars)
+        os.environ['DEPLOYMENT_ENV_KEYS'] = ','.join(env_vars)
+
+    # Check if dependency steps are enabled in config
+    if not config.get('deployment.steps.post_deployment.dependencies.enabled', True):
+        print("ℹ️  Dependency configuration steps are disabled in configuration")
+        # If no sibling post-deployment substep is enabled either, there is
+        # nothing for this script to do. Exit before constructing
+        # GenericPostDeployer - that construction is what triggers the
+        # deferred AWS SDK import (lightsail_common loads boto3 lazily and
+        # lightsail_rds is only imported on the RDS path) and the SSH
+        # session setup
+        post_deploy_steps = config.get('deployment.steps.post_deployment', {})
+        others_enabled = any(
+            step.get('enabled', True)
+            for name, step in post_deploy_steps.items()
+            if name != 'dependencies' and isinstance(step, dict)
+        )
+        if not others_enabled:
+            print("ℹ️  No post-deployment steps enabled - nothing to do")
+            sys.exit(0)
+
+    # Imported here rather than at module top so the early exits above stay
+    # clear of botocore - past this point the deployer construction loads
+    # the SDK anyway. Anything not caught below (bugs) propagates to the
+    # default handler with a full traceback
+    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+    try:
         # Create generic post-deployer and deploy application
         post_deployer = GenericPostDeployer(
-            instance_name, 
-            region, 
-            config, 
-            os_type=args.os_type, 
+            instance_name,
+            region,
+            config,
+            os_type=args.os_type,
             package_manager=args.package_manager
         )
-        
-        if post_deployer.deploy_application(
-            args.package_file, 
-            verify=args.verify, 
-            cleanup=args.cleanup,
-            env_vars=env_vars
-        ):
-            # Print deployment summary
-            post_deployer._print_deployment_summary()
-            print("🎉 Generic post-deployment steps completed successfully!")
-            sys.exit(0)
-        else:
-            print("❌ Generic post-deployment steps failed")
-            sys.exit(1)
-            
-    except Exception as e:
-        print(f"❌ Error in generic post-deployment steps: {str(e)}")
-        import traceback
-        traceback.print_exc()
+
+        success = post_deployer.deploy_application(
+            args.package_file,
+            verify=args.verify,
+            cleanup=args.cleanup
+        )
+    except (BotoCoreError, ClientError, NoCredentialsError) as e:
+        print(f"❌ AWS error in generic post-deployment steps: {str(e)}")
+        sys.exit(1)
+
+    if success:
+        # Print deployment summary
+        post_deployer._print_deployment_summary()
+        print("🎉 Generic post-deployment steps completed successfully!")
+        sys.exit(0)
+    else:
+        print("❌ Generic post-deployment steps failed")
         sys.exit(1)
 
 if __name__ == '__main__':
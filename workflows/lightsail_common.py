@@ -4,21 +4,52 @@ Common utilities for AWS Lightsail deployment workflows
 This module provides shared functionality for SSH connections, file operations, and AWS client management
 """
 
-import boto3
 import subprocess
 import tempfile
+import shutil
 import os
 import time
 import sys
 import socket
-from botocore.exceptions import ClientError, NoCredentialsError
+
+# boto3 is multi-megabyte and dominates interpreter startup, so it is
+# imported lazily on first client construction - --help and config-error
+# paths in the CLI scripts never pay for it
+boto3 = None
+ClientError = None
+NoCredentialsError = None
+
+def _import_aws_sdk():
+    """Import boto3/botocore into the module globals on first use"""
+    global boto3, ClientError, NoCredentialsError
+    if boto3 is None:
+        import boto3 as _boto3
+        from botocore.exceptions import ClientError as _ClientError
+        from botocore.exceptions import NoCredentialsError as _NoCredentialsError
+        boto3 = _boto3
+        ClientError = _ClientError
+        NoCredentialsError = _NoCredentialsError
 
 class LightsailBase:
     """Base class for Lightsail operations with common SSH and AWS functionality"""
-    
+
+    # SSH multiplexing options - the first connection establishes a master that
+    # subsequent commands reuse, skipping the full handshake per invocation
+    SSH_MULTIPLEX_OPTS = [
+        '-o', 'ControlMaster=auto',
+        '-o', 'ControlPath=~/.ssh/cm-%r@%h:%p',
+        '-o', 'ControlPersist=60s'
+    ]
+
     def __init__(self, instance_name, region='us-east-1'):
         self.instance_name = instance_name
         self.region = region
+        try:
+            # ControlPath sockets live under ~/.ssh - make sure it exists
+            os.makedirs(os.path.expanduser('~/.ssh'), mode=0o700, exist_ok=True)
+        except OSError:
+            pass  # ssh falls back to unmultiplexed connections
+        _import_aws_sdk()
         try:
             self.lightsail = boto3.client('lightsail', region_name=region)
         except NoCredentialsError:
@@ -207,12 +238,36 @@ class LightsailBase:
             ssh_details = ssh_response['accessDetails']
             
             key_path, cert_path = self.create_ssh_files(ssh_details)
-            
+
             try:
+                # Prefer rsync when available - delta transfer plus compression
+                # makes repeat uploads of mostly-unchanged packages far cheaper
+                # than a full scp re-copy; fall back to scp otherwise
+                if shutil.which('rsync'):
+                    ssh_transport = ' '.join([
+                        'ssh', '-i', key_path, '-o', f'CertificateFile={cert_path}',
+                        '-o', 'StrictHostKeyChecking=no', '-o', 'UserKnownHostsFile=/dev/null',
+                        '-o', 'ConnectTimeout=30', '-o', 'IdentitiesOnly=yes',
+                        *self.SSH_MULTIPLEX_OPTS
+                    ])
+                    rsync_cmd = [
+                        'rsync', '-az', '--inplace', '--partial', '-e', ssh_transport,
+                        local_path, f'{ssh_details["username"]}@{ssh_details["ipAddress"]}:{remote_path}'
+                    ]
+
+                    result = subprocess.run(rsync_cmd, capture_output=True, text=True, timeout=timeout)
+
+                    if result.returncode == 0:
+                        print(f"   ✅ File copied successfully (rsync)")
+                        return True
+
+                    print(f"   ⚠️ rsync transfer failed (exit code: {result.returncode}), falling back to scp...")
+
                 scp_cmd = [
                     'scp', '-i', key_path, '-o', f'CertificateFile={cert_path}',
                     '-o', 'StrictHostKeyChecking=no', '-o', 'UserKnownHostsFile=/dev/null',
                     '-o', 'ConnectTimeout=30', '-o', 'IdentitiesOnly=yes',
+                    *self.SSH_MULTIPLEX_OPTS,
                     local_path, f'{ssh_details["username"]}@{ssh_details["ipAddress"]}:{remote_path}'
                 ]
                 
@@ -234,6 +289,59 @@ class LightsailBase:
             print(f"   ❌ Error copying file: {str(e)}")
             return False
 
+    def stream_file_to_command(self, local_path, remote_command, timeout=300):
+        """
+        Stream a local file into a command on the instance via SSH stdin
+
+        Piping e.g. a tarball straight into 'tar -xzf -' overlaps the network
+        transfer with remote decompression and never writes the intermediate
+        file to the remote disk.
+
+        Args:
+            local_path (str): Local file to stream
+            remote_command (str): Remote command that reads from stdin
+            timeout (int): Transfer timeout in seconds
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            print(f"📤 Streaming {local_path} into remote command: {remote_command}")
+
+            ssh_response = self.lightsail.get_instance_access_details(instanceName=self.instance_name)
+            ssh_details = ssh_response['accessDetails']
+
+            key_path, cert_path = self.create_ssh_files(ssh_details)
+
+            try:
+                ssh_cmd = [
+                    'ssh', '-i', key_path, '-o', f'CertificateFile={cert_path}',
+                    '-o', 'StrictHostKeyChecking=no', '-o', 'UserKnownHostsFile=/dev/null',
+                    '-o', 'ConnectTimeout=30', '-o', 'IdentitiesOnly=yes',
+                    '-o', 'BatchMode=yes', '-o', 'LogLevel=ERROR',
+                    *self.SSH_MULTIPLEX_OPTS,
+                    f'{ssh_details["username"]}@{ssh_details["ipAddress"]}', remote_command
+                ]
+
+                with open(local_path, 'rb') as local_file:
+                    result = subprocess.run(ssh_cmd, stdin=local_file, capture_output=True, text=True, timeout=timeout)
+
+                if result.returncode == 0:
+                    print(f"   ✅ Stream completed successfully")
+                    return True
+                else:
+                    print(f"   ❌ Stream failed (exit code: {result.returncode})")
+                    if result.stderr.strip():
+                        print(f"   Error: {result.stderr.strip()}")
+                    return False
+
+            finally:
+                self._cleanup_ssh_files(key_path, cert_path)
+
+        except Exception as e:
+            print(f"   ❌ Error streaming file: {str(e)}")
+            return False
+
     def get_instance_info(self):
         """
         Get instance information including public IP and state
@@ -413,6 +521,7 @@ class LightsailBase:
                 '-o', 'IdentitiesOnly=yes', '-o', 'TCPKeepAlive=yes',
                 '-o', 'ExitOnForwardFailure=yes', '-o', 'BatchMode=yes',
                 '-o', 'PreferredAuthentications=publickey', '-o', 'LogLevel=VERBOSE',
+                *self.SSH_MULTIPLEX_OPTS,
                 f'{ssh_details["username"]}@{ssh_details["ipAddress"]}', safe_command
             ]
         else:
@@ -422,6 +531,7 @@ class LightsailBase:
                 '-o', 'ConnectTimeout=30', '-o', 'ServerAliveInterval=10',
                 '-o', 'ServerAliveCountMax=3', '-o', 'IdentitiesOnly=yes',
                 '-o', 'BatchMode=yes', '-o', 'LogLevel=ERROR',
+                *self.SSH_MULTIPLEX_OPTS,
                 f'{ssh_details["username"]}@{ssh_details["ipAddress"]}', safe_command
             ]
 
@@ -550,6 +660,7 @@ class LightsailBase:
                     'ssh', '-i', key_path, '-o', f'CertificateFile={cert_path}',
                     '-o', 'StrictHostKeyChecking=no', '-o', 'UserKnownHostsFile=/dev/null',
                     '-o', 'ConnectTimeout=10', '-o', 'BatchMode=yes', '-o', 'LogLevel=ERROR',
+                    *self.SSH_MULTIPLEX_OPTS,
                     f'{ssh_details["username"]}@{ssh_details["ipAddress"]}', log_command
                 ]
                 
@@ -196,7 +196,14 @@ class OSDetector:
         Returns:
             Dictionary with user information
         """
-        user_configs = {
+        # Copy so callers that annotate the result (deploy scripts assign
+        # package_manager/service_manager onto it) don't mutate the shared
+        # class-level table or each other's os_info
+        return dict(cls.USER_CONFIGS.get(os_type, cls.USER_CONFIGS['ubuntu']))
+
+    # OS-specific user information - built once at class definition so
+    # get_user_info is a plain dict lookup on every call
+    USER_CONFIGS = {
             'ubuntu': {
                 'default_user': 'ubuntu',
                 'web_user': 'www-data',
@@ -233,9 +240,7 @@ class OSDetector:
                 'apache_user': 'apache',
                 'apache_group': 'apache'
             }
-        }
-        
-        return user_configs.get(os_type, user_configs['ubuntu'])
+    }
 
 if __name__ == "__main__":
     # Test the OS detector